@@ -1,202 +1,488 @@
 """
 Expense Tracker Program
 Allows users to add, edit, delete, view, and visualize expenses.
-Data is stored persistently in a JSON file.
+Data is stored persistently in an append-only JSON Lines log.
 """
 from datetime import datetime
-from collections import defaultdict
+import atexit
 import json
+import math
+import os
+import re
+import sys
+import numpy as np
 import matplotlib.pyplot as plt
+try:
+    import orjson # Faster JSON (de)serialization when available
+except ImportError:
+    orjson = None
+
+MAX_DENSE_BINS = 1 << 20 # Widest key range binned directly into a dense array
+LOG_BUFFER_SIZE = 128 * 1024 # Write buffer reused for the whole session
+FLUSH_EVERY = 10 # Flush the log after this many appended records
+STREAM_LOAD_THRESHOLD = 4 * 1024 * 1024 # Logs larger than this build expenses line by line
+CHART_FILE = "expense_summary.png" # Where the chart is saved when there is no display
+_FLOAT_RE = re.compile(r'[+-]?(\d+(\.\d*)?|\.\d+)', re.ASCII)
+_INT_RE = re.compile(r'[+-]?\d{1,18}', re.ASCII) # Capped well below int()'s digit limit
+_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})', re.ASCII) # Same shapes strptime's "%Y-%m-%d" accepts
+
+def _dumps(obj):
+    """Serializes an object to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+def _loads(raw):
+    """Parses JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+def _bin_sum(keys, amounts):
+    """Sums amounts per distinct key in one vectorized pass; returns (sorted keys, totals)."""
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    return unique_keys, np.bincount(inverse.ravel(), weights=amounts, minlength=len(unique_keys))
+def _dense_bin_sum(codes, amounts):
+    """Sums amounts per integer code by indexing a dense array, avoiding the sort in np.unique."""
+    if not len(codes):
+        return codes, amounts
+    lo = codes.min()
+    offsets = codes - lo
+    if offsets.max() >= MAX_DENSE_BINS:
+        return _bin_sum(codes, amounts)
+    totals = np.bincount(offsets, weights=amounts)
+    used = np.flatnonzero(np.bincount(offsets))
+    return used + lo, totals[used]
+def _accumulate(totals, key, amount, sign):
+    """Adds (sign=1) or removes (sign=-1) an amount under key, dropping keys with no expenses left."""
+    total, count = totals.get(key, (0.0, 0))
+    count += sign
+    if count:
+        totals[key] = (total + amount, count)
+    else:
+        del totals[key]
+def _civil_from_days(days):
+    """Converts days since 1970-01-01 to (year, month) arrays with integer arithmetic only
+    (Howard Hinnant's civil_from_days)."""
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097 # Day of 400-year era
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365 # Year of era
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100) # Day of year, counted from March 1
+    mp = (5 * doy + 2) // 153
+    month = mp + np.where(mp < 10, 3, -9)
+    return yoe + era * 400 + (month <= 2), month
+def _days_before_year(year):
+    """Returns days from 1970-01-01 to January 1 of each year (Hinnant's days_from_civil)."""
+    y = year - 1 # January counts as the end of the previous March-based year
+    era = y // 400
+    yoe = y - era * 400
+    return era * 146097 + yoe * 365 + yoe // 4 - yoe // 100 + 306 - 719468
+def _check_amount(value):
+    """Returns a stored amount unchanged, raising TypeError if it is not a number
+    and ValueError if it is infinite or NaN (JSON cannot round-trip those)."""
+    if not isinstance(value, (int, float)):
+        raise TypeError(f"amount must be a number, not {type(value).__name__}")
+    if not math.isfinite(value):
+        raise ValueError(f"amount must be finite, not {value}")
+    return value
+def _parse_float(text):
+    """Converts text to a float, or returns None if it is not a plain, finite decimal number."""
+    text = text.strip()
+    if not _FLOAT_RE.fullmatch(text):
+        return None
+    value = float(text) # Very long digit strings overflow to inf
+    return value if math.isfinite(value) else None
+def _parse_int(text):
+    """Converts text to an int, or returns None if it is not a whole number."""
+    text = text.strip()
+    return int(text) if _INT_RE.fullmatch(text) else None
+def _parse_date(value):
+    """Parses a YYYY-MM-DD string into a date, or returns None if it is invalid."""
+    match = _DATE_RE.fullmatch(value) if isinstance(value, str) else None
+    if match is None:
+        return None
+    year, month, day = map(int, match.groups())
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return None
+    try:
+        return datetime(year, month, day).date() # Rejects days past the end of the month
+    except ValueError:
+        return None
 
 class Expense:
     """Represents a single expense with amount, category, and date."""
+    __slots__ = ('amount', '_category', 'category_lc', '_date', '_date_obj')
     def __init__(self, amount, category, date):
         self.amount = amount
         self.category = category
         self.date = date
+    @property
+    def category(self):
+        return self._category
+    @category.setter
+    def category(self, value):
+        """Stores the interned category and its lowercase form used for case-insensitive matching."""
+        self._category = sys.intern(value) # One shared string per distinct category
+        self.category_lc = sys.intern(value.lower())
+    @property
+    def date(self):
+        return self._date
+    @date.setter
+    def date(self, value):
+        """Stores the date string and caches its parsed form (None if invalid)."""
+        self._date = value
+        self._date_obj = _parse_date(value)
     def __str__(self):
-        return f"Category: {self.category}, Amount: {self.amount}, Date: {self.date}"
+        return 'Category: ' + self._category + ', Amount: ' + format(self.amount, '.2f') + ', Date: ' + str(self._date)
     def to_dict(self):
         return {
-            'amount': self.amount,
+            'amount': _check_amount(self.amount), # Never write an amount the loader would reject
             'category': self.category,
             'date': self.date
         }
     @staticmethod
     def from_dict(data):
-        return Expense(data['amount'], data['category'], data['date'])
+        return Expense(_check_amount(data['amount']), data['category'], data['date'])
+    @classmethod
+    def _bulk_from_records(cls, records):
+        """Builds expenses from a list of dicts, filling slots directly instead of calling __init__."""
+        intern = sys.intern
+        new = object.__new__
+        out = [None] * len(records)
+        for i, record in enumerate(records):
+            exp = new(cls)
+            exp.amount = _check_amount(record['amount'])
+            category = record['category']
+            exp._category = intern(category)
+            exp.category_lc = intern(category.lower())
+            exp._date = date = record['date']
+            exp._date_obj = _parse_date(date)
+            out[i] = exp
+        return out
 
 class ExpenseTracker:
     """Manages expenses with options to add, edit, delete, view summaries, and plot graphs."""
     def __init__(self):
         self.expenses = [] # List to store all expense objects
+        self._cols = None # Cached column arrays, rebuilt after changes
+        self._total = 0.0 # Running aggregates, kept in step with self.expenses
+        self._by_category = {} # Category -> (total, count)
+        self._by_category_lc = {} # Lowercase category -> (total, count)
+        self._by_month = {} # year * 12 + month - 1 -> (total, count)
+        self._fh = None # Log file kept open across the session
+        self._fh_name = None
+        self._pending = 0 # Records appended since the last flush
+        self._loaded_from = None # Log whose full contents are in memory; only it may be compacted
+        self._fig = None # Chart figure, axes, and bars reused between graphical summaries
+        self._ax = None
+        self._bars = None
+        self._bar_categories = None
+        atexit.register(self.close)
     def validate_date(self, date_str):
         """Validates if the provided date string is in YYYY-MM-DD format."""
-        try:
-            datetime.strptime(date_str, "%Y-%m-%d")
-            return True
-        except ValueError:
-            return False
+        return _parse_date(date_str) is not None
+    def _track(self, exp, sign):
+        """Adds (sign=1) or removes (sign=-1) an expense from the running aggregates."""
+        amount = sign * exp.amount
+        self._total += amount
+        _accumulate(self._by_category, exp.category, amount, sign)
+        _accumulate(self._by_category_lc, exp.category_lc, amount, sign)
+        date_obj = exp._date_obj
+        if date_obj is not None:
+            _accumulate(self._by_month, date_obj.year * 12 + date_obj.month - 1, amount, sign)
+        self._cols = None
+    def _rebuild_aggregates(self):
+        """Recomputes the running aggregates from scratch, e.g. after loading."""
+        self._total = 0.0
+        self._by_category = {}
+        self._by_category_lc = {}
+        self._by_month = {}
+        for exp in self.expenses:
+            self._track(exp, 1)
+    def _columns(self):
+        """Returns expenses as parallel NumPy arrays: amounts and dates (NaT if invalid)."""
+        if self._cols is None:
+            expenses = self.expenses
+            amounts = np.fromiter((exp.amount for exp in expenses), dtype=np.float64, count=len(expenses))
+            dates = np.array([exp._date_obj or 'NaT' for exp in expenses], dtype='datetime64[D]')
+            self._cols = (amounts, dates)
+        return self._cols
     def add_expenses(self):
         """Adds a new expense entry after taking validated input from the user."""
-        try:
-            amount = float(input("Enter the amount of the expense: ").strip())
-            category = input("Enter the category of the expense: ").strip()
-            date = input("Enter date (YYYY-MM-DD) or press Enter for today: ").strip()
-            if not date:
-                date = datetime.now().strftime("%Y-%m-%d")
-            if not self.validate_date(date):
-                print("Invalid date format. Please use YYYY-MM-DD.")
-                return
-            expense = Expense(amount, category, date)
-            self.expenses.append(expense) # Add expense to list
-            print(f"Expense of amount {amount} added successfully in {category} category on {date}.")
-            self.save_to_file()
-        except ValueError:
+        amount = _parse_float(input("Enter the amount of the expense: "))
+        if amount is None:
             print("Invalid input, please enter a numeric amount.")
+            return
+        category = input("Enter the category of the expense: ").strip()
+        date = input("Enter date (YYYY-MM-DD) or press Enter for today: ").strip()
+        if not date:
+            date = datetime.now().strftime("%Y-%m-%d")
+        expense = Expense(amount, category, date)
+        if expense._date_obj is None: # Date is parsed once when the expense is built
+            print("Invalid date format. Please use YYYY-MM-DD.")
+            return
+        self.expenses.append(expense) # Add expense to list
+        self._track(expense, 1)
+        print(f"Expense of amount {amount} added successfully in {category} category on {date}.")
+        self.append_to_file(expense.to_dict())
     def view_summary(self):
         """Provides options to view total spending by category, total, or over time."""
         if not self.expenses:
             print("No expenses recorded yet.")
             return
-        try:
-            choice = int(input(
-                "\nEnter:\n"
-                "1 for Total spending for a specific category\n"
-                "2 for Total overall spending\n"
-                "3 for Spending over time\n"
-                "Your choice: ").strip())
-        except ValueError:
+        choice = _parse_int(input(
+            "\nEnter:\n"
+            "1 for Total spending for a specific category\n"
+            "2 for Total overall spending\n"
+            "3 for Spending over time\n"
+            "Your choice: "))
+        if choice is None:
             print("Invalid input, please enter a number.")
             return
         if choice == 1:
             # Total spending for a specific category
             category = input("Enter the category: ").strip()
-            total = sum(exp.amount for exp in self.expenses if exp.category.lower() == category.lower())
+            total = self._by_category_lc.get(category.lower(), (0.0, 0))[0]
             print(f"The total spending in '{category}' is: Rs {total:.2f}")
         elif choice == 2:
             # Total overall spending
-            total = sum(exp.amount for exp in self.expenses)
+            total = self._total
             print(f"The total overall spending is: Rs {total:.2f}")
         elif choice == 3:
             # Spending over time: daily, monthly, weekly
-            try:
-                time_choice = int(input(
-                    "Enter:\n"
-                    "1 for Daily Summary\n"
-                    "2 for Monthly Summary\n"
-                    "3 for Weekly Summary\n"
-                    "Your choice: ").strip())
-            except ValueError:
+            time_choice = _parse_int(input(
+                "Enter:\n"
+                "1 for Daily Summary\n"
+                "2 for Monthly Summary\n"
+                "3 for Weekly Summary\n"
+                "Your choice: "))
+            if time_choice is None:
                 print("Invalid input, please enter a number.")
                 return
-            summary = defaultdict(float)
-            for expense in self.expenses:
-                if not self.validate_date(expense.date):
-                    print(f"Skipping invalid date format: {expense.date}")
-                    continue
-                date_obj = datetime.strptime(expense.date, "%Y-%m-%d")
-                if time_choice == 1:
-                    key = expense.date
-                elif time_choice == 2:
-                    key = date_obj.strftime("%Y-%m")
-                elif time_choice == 3:
-                    year = date_obj.year
-                    week = date_obj.isocalendar()[1]
-                    key = f"{year}-W{week}"
-                else:
-                    print("Invalid choice")
-                    return
-                summary[key] += expense.amount
+            if time_choice not in (1, 2, 3):
+                print("Invalid choice")
+                return
+            amounts, dates = self._columns()
+            valid = ~np.isnat(dates)
+            for idx in np.flatnonzero(~valid):
+                print(f"Skipping invalid date format: {self.expenses[idx].date}")
+            days, amounts = dates[valid], amounts[valid]
+            if time_choice == 1:
+                keys, totals = _dense_bin_sum(days.view('i8'), amounts) # Days since 1970-01-01
+                labels = [str(k) for k in keys.astype('datetime64[D]')]
+            elif time_choice == 2:
+                keys = sorted(self._by_month)
+                totals = [self._by_month[k][0] for k in keys]
+                labels = [f"{k // 12:04d}-{k % 12 + 1:02d}" for k in keys]
+            else:
+                # Weeks counted from Monday 1969-12-29 (1970-01-01 was a Thursday)
+                keys, totals = _dense_bin_sum((days.view('i8') + 3) // 7, amounts)
+                # An ISO week belongs to the year of its Thursday; encode it as year * 100 + week
+                thursdays = keys * 7
+                years, _ = _civil_from_days(thursdays)
+                weeks = (thursdays - _days_before_year(years)) // 7 + 1
+                codes = years * 100 + weeks
+                labels = [f"{k // 100:04d}-W{k % 100:02d}" for k in codes.tolist()]
             print("\nSpending over time summary:")
-            for period, amount in sorted(summary.items()):
+            for period, amount in zip(labels, totals):
                 print(f"{period}: Rs {amount:.2f}")
         else:
             print("Please choose a valid option.")
-    def save_to_file(self, filename="expenses.json"):
-        """Saves all expenses to a JSON file for persistence."""
-        with open(filename, 'w') as file:
-            json.dump([exp.to_dict() for exp in self.expenses], file, indent=4)
-    def load_from_file(self, filename="expenses.json"):
-        """Loads expenses from a JSON file if it exists."""
+    def append_to_file(self, record, filename="expenses.jsonl"):
+        """Appends a single record to the JSON Lines log instead of rewriting the whole file.
+        Nothing is written unless this log was fully loaded, since edit and delete indices
+        only make sense against the log's own contents."""
+        if self._loaded_from != filename:
+            print(f"Warning: saved expenses could not be loaded, so this change was not written to {filename}.")
+            return
+        if self._fh is None or self._fh_name != filename:
+            self.close()
+            self._fh = open(filename, 'ab', buffering=LOG_BUFFER_SIZE)
+            self._fh_name = filename
+        self._fh.write(_dumps(record) + b'\n')
+        self._pending += 1
+        if self._pending >= FLUSH_EVERY:
+            self.flush()
+    def flush(self):
+        """Pushes buffered log records to disk."""
+        if self._fh is not None:
+            self._fh.flush()
+        self._pending = 0
+    def close(self):
+        """Flushes and closes the log file if it is open."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            self._fh_name = None
+        self._pending = 0
+    def compact(self, filename="expenses.jsonl"):
+        """Rewrites the log so it holds one plain record per current expense.
+        The new log is written to a temporary file and swapped in atomically, so a crash
+        mid-write leaves the previous log intact. Does nothing unless this log was fully
+        loaded, so an unreadable log is never replaced."""
+        if self._loaded_from != filename:
+            print(f"{filename} was not fully loaded; leaving it unchanged.")
+            return
+        self.close()
+        tmp = filename + '.tmp'
+        with open(tmp, 'wb') as file:
+            file.write(b''.join(_dumps(exp.to_dict()) + b'\n' for exp in self.expenses))
+        os.replace(tmp, filename)
+    def _migrate_legacy_file(self, legacy_filename, filename):
+        """Loads a pre-log JSON array file and writes it out as the new log once.
+        Returns False if there is no legacy file to migrate."""
         try:
-            with open(filename, 'r') as file:
-                data = json.load(file)
-                self.expenses = [Expense.from_dict(item) for item in data]
-            print(f"Loaded {len(self.expenses)} expenses from {filename}.")
+            with open(legacy_filename, 'rb') as file:
+                data = _loads(file.read())
+            expenses = Expense._bulk_from_records(data)
         except FileNotFoundError:
-            print("No previous data found. Starting fresh.")
-        except json.JSONDecodeError:
+            return False
+        except (ValueError, KeyError, IndexError, TypeError, AttributeError): # Decode errors subclass ValueError
+            print(f"{legacy_filename} is corrupt. Starting with an empty list.")
+            print(f"Changes will not be saved until {legacy_filename} is repaired and migrated.")
+            return True # _loaded_from stays unset, so no new log is created to hide the old file
+        self.expenses = expenses
+        self._rebuild_aggregates()
+        self._loaded_from = filename
+        self.compact(filename)
+        print(f"Migrated {len(self.expenses)} expenses from {legacy_filename} to {filename}.")
+        return True
+    def load_from_file(self, filename="expenses.jsonl", legacy_filename="expenses.json"):
+        """Loads expenses by replaying the JSON Lines log if it exists, migrating the
+        older JSON array file the first time."""
+        items = []
+        truncated = False # Last line failed to parse, e.g. a crash cut off the final append
+        try:
+            # Small logs are replayed on plain dicts and bulk-built at the end; large ones build
+            # each Expense as its line is parsed so all raw dicts are never held at once
+            stream = os.path.getsize(filename) > STREAM_LOAD_THRESHOLD
+            with open(filename, 'rb') as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    if truncated:
+                        raise ValueError("unreadable record before the end of the log")
+                    try:
+                        record = _loads(line)
+                    except ValueError:
+                        truncated = True
+                        continue
+                    op = record.get('op')
+                    if op == 'del':
+                        items.pop(record['idx'])
+                        continue
+                    data = record['data'] if op == 'edit' else record
+                    item = Expense.from_dict(data) if stream else data
+                    if op == 'edit':
+                        items[record['idx']] = item
+                    else:
+                        items.append(item)
+            expenses = items if stream else Expense._bulk_from_records(items)
+        except FileNotFoundError:
+            if not self._migrate_legacy_file(legacy_filename, filename):
+                print("No previous data found. Starting fresh.")
+                self._loaded_from = filename
+            return
+        except (ValueError, KeyError, IndexError, TypeError, AttributeError): # Decode errors subclass ValueError
             print("Data file is corrupt. Starting with an empty list.")
+            print(f"Changes will not be saved until {filename} is repaired.")
+            return
+        self.expenses = expenses
+        self._rebuild_aggregates()
+        self._loaded_from = filename
+        print(f"Loaded {len(self.expenses)} expenses from {filename}.")
+        if truncated:
+            # Drop the partial line now so later appends do not run into it
+            print("Ignored an incomplete last record.")
+            self.compact(filename)
+    def _print_numbered(self):
+        """Prints every expense with its 1-based number in a single write."""
+        sys.stdout.write('\n'.join([f"{idx}. {exp}" for idx, exp in enumerate(self.expenses, 1)]) + '\n')
     def delete_expense(self):
         """Deletes an expense entry selected by the user."""
         if not self.expenses:
             print("No expenses to delete.")
             return
-        for idx, exp in enumerate(self.expenses):
-            print(f"{idx + 1}. {exp}")
-        try:
-            choice = int(input("Enter the number of the expense to delete: ").strip())
-            if 1 <= choice <= len(self.expenses):
-                removed = self.expenses.pop(choice - 1)
-                print(f"Deleted: {removed}")
-                self.save_to_file()
-            else:
-                print("Invalid selection.")
-        except ValueError:
+        self._print_numbered()
+        choice = _parse_int(input("Enter the number of the expense to delete: "))
+        if choice is None:
             print("Invalid input.")
+        elif 1 <= choice <= len(self.expenses):
+            removed = self.expenses.pop(choice - 1)
+            self._track(removed, -1)
+            print(f"Deleted: {removed}")
+            self.append_to_file({'op': 'del', 'idx': choice - 1})
+        else:
+            print("Invalid selection.")
     def edit_expense(self):
         """Edits an existing expense entry selected by the user."""
         if not self.expenses:
             print("No expenses to edit.")
             return
-        for idx, exp in enumerate(self.expenses):
-            print(f"{idx + 1}. {exp}")
-        try:
-            choice = int(input("Enter the number of the expense to edit: ").strip())
-            if 1 <= choice <= len(self.expenses):
-                expense = self.expenses[choice - 1]
-                print(f"Editing: {expense}")
-                new_amount = input("Enter new amount (or press Enter to keep current): ").strip()
-                new_category = input("Enter new category (or press Enter to keep current): ").strip()
-                new_date = input("Enter new date (YYYY-MM-DD) (or press Enter to keep current): ").strip()
-                if new_amount:
-                    try:
-                        expense.amount = float(new_amount)
-                    except ValueError:
-                        print("Invalid amount. Keeping previous.")
-                if new_category:
-                    expense.category = new_category
-                if new_date:
-                    if self.validate_date(new_date):
-                        expense.date = new_date
-                    else:
-                        print("Invalid date format. Keeping previous.")
-                self.save_to_file()
-                print("Expense updated successfully.")
-            else:
-                print("Invalid selection.")
-        except ValueError:
+        self._print_numbered()
+        choice = _parse_int(input("Enter the number of the expense to edit: "))
+        if choice is None:
             print("Invalid input.")
+            return
+        if not 1 <= choice <= len(self.expenses):
+            print("Invalid selection.")
+            return
+        expense = self.expenses[choice - 1]
+        print(f"Editing: {expense}")
+        new_amount = input("Enter new amount (or press Enter to keep current): ").strip()
+        new_category = input("Enter new category (or press Enter to keep current): ").strip()
+        new_date = input("Enter new date (YYYY-MM-DD) (or press Enter to keep current): ").strip()
+        self._track(expense, -1) # Re-added below with the updated values
+        if new_amount:
+            amount = _parse_float(new_amount)
+            if amount is None:
+                print("Invalid amount. Keeping previous.")
+            else:
+                expense.amount = amount
+        if new_category:
+            expense.category = new_category
+        if new_date:
+            if self.validate_date(new_date):
+                expense.date = new_date
+            else:
+                print("Invalid date format. Keeping previous.")
+        self._track(expense, 1)
+        self.append_to_file({'op': 'edit', 'idx': choice - 1, 'data': expense.to_dict()})
+        print("Expense updated successfully.")
     def graphical_summary(self):
         """Displays a bar graph of total expenses by category."""
         if not self.expenses:
             print("No data for graphical summary.")
             return
-        category_totals = defaultdict(float)
-        for exp in self.expenses:
-            category_totals[exp.category] += exp.amount
-        categories = list(category_totals.keys())
-        amounts = [category_totals[cat] for cat in categories]
-        plt.figure(figsize=(10, 6))
-        plt.bar(categories, amounts, color='green') # Bar graph
-        plt.xlabel("Category")
-        plt.ylabel("Total Expenses (Rs)")
-        plt.title("Expense Distribution by Category")
-        plt.xticks(rotation=45)
-        plt.grid(axis='y')
-        plt.tight_layout()
-        plt.show()
+        categories = list(self._by_category)
+        amounts = [total for total, _ in self._by_category.values()]
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            # First chart, or the previous window was closed
+            self._fig, self._ax = plt.subplots(figsize=(10, 6))
+            self._bars = None
+        fig, ax = self._fig, self._ax
+        if self._bars is not None and self._bar_categories == categories:
+            # Same categories as last time: only the bar heights change
+            for bar, height in zip(self._bars, amounts):
+                bar.set_height(height)
+            ax.relim()
+            ax.autoscale_view()
+        else:
+            ax.clear()
+            self._bars = ax.bar(categories, amounts, color='green') # Bar graph
+            self._bar_categories = categories
+            ax.set_xlabel("Category")
+            ax.set_ylabel("Total Expenses (Rs)")
+            ax.set_title("Expense Distribution by Category")
+            ax.tick_params(axis='x', labelrotation=45)
+            ax.grid(axis='y')
+        fig.tight_layout()
+        if plt.get_backend().lower() == 'agg':
+            # Non-interactive backend: nothing can be shown, so save the chart instead
+            fig.savefig(CHART_FILE)
+            print(f"Chart saved to {CHART_FILE}.")
+        else:
+            fig.canvas.draw_idle()
+            plt.show()
 """Main interactive loop for the Expense Tracker."""
 if __name__ == "__main__":
     tracker = ExpenseTracker()
@@ -221,6 +507,7 @@ if __name__ == "__main__":
         elif choice == '5':
             tracker.graphical_summary()
         elif choice == '6':
+            tracker.compact() # Collapse the log once per session
             print("Thank you for using Expense Tracker. Goodbye!")
             break
         else: